@@ -19,6 +19,7 @@
 
 import json
 from types import SimpleNamespace
+from typing import List
 import torch
 import bittensor
 
@@ -85,7 +86,23 @@ class endpoint:
             error_msg = 'Endpoints tensor should be length {}, got {}'.format( tensor.shape[0], ENDPOINT_BUFFER_SIZE)
             raise ValueError(error_msg)
             
-        endpoint_list = tensor.tolist()
+        return endpoint.from_list( tensor.tolist() )
+
+    @staticmethod
+    def from_tensor_batch( tensor: torch.LongTensor ) -> List['bittensor.Endpoint']:
+        """ Return a list of endpoints from a tensor of shape (n, ENDPOINT_BUFFER_SIZE), one per row
+        """
+        if len(tensor.shape) != 2 or tensor.shape[1] != ENDPOINT_BUFFER_SIZE:
+            error_msg = 'Endpoints tensor should have shape (n, {}), got {}'.format( ENDPOINT_BUFFER_SIZE, list(tensor.shape) )
+            raise ValueError(error_msg)
+
+        # A single tensor to list conversion for the whole batch.
+        return [ endpoint.from_list( endpoint_list ) for endpoint_list in tensor.tolist() ]
+
+    @staticmethod
+    def from_list( endpoint_list: List[int] ) -> 'bittensor.Endpoint':
+        """ Return an endpoint with spec from the list representation of its tensor
+        """
         if -1 in endpoint_list:
             endpoint_list = endpoint_list[ :endpoint_list.index(-1)]
             
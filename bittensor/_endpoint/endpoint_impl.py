@@ -19,6 +19,7 @@
 
 import bittensor
 import json
+import numpy
 import torch
 import bittensor.utils.networking as net
 
@@ -43,6 +44,7 @@ class Endpoint:
         self.port = port
         self.coldkey = coldkey
         self.modality = modality
+        self._encoded = None
         if self.check_format():
             # possibly throw a warning here.
             pass
@@ -110,15 +112,30 @@ class Endpoint:
     def to_tensor( self ) -> torch.LongTensor: 
         """ Return the specification of an endpoint as a tensor
         """ 
-        string_json = self.dumps()
-        bytes_json = bytes(string_json, 'utf-8')
-        ints_json = list(bytes_json)
-        if len(ints_json) > ENDPOINT_BUFFER_SIZE:
-            raise ValueError('Endpoint {} representation is too large, got size {} should be less than {}'.format(self, len(ints_json), ENDPOINT_BUFFER_SIZE))
+        ints_json = list( self._to_bytes() )
         ints_json += [-1] * (ENDPOINT_BUFFER_SIZE - len(ints_json))
         endpoint_tensor = torch.tensor( ints_json, dtype=torch.int64, requires_grad=False)
         return endpoint_tensor
 
+    def write_into( self, out: numpy.ndarray ):
+        """ Writes the tensor specification of an endpoint into a preallocated int64 row of length ENDPOINT_BUFFER_SIZE
+        """ 
+        bytes_json = self._to_bytes()
+        out[ :len(bytes_json) ] = numpy.frombuffer( bytes_json, dtype=numpy.uint8 )
+        out[ len(bytes_json): ] = -1
+
+    def _to_bytes( self ) -> bytes:
+        """ Return the utf-8 encoded json specification of an endpoint, memoized until one of its fields changes
+        """ 
+        spec = ( self.version, self.uid, self.hotkey, self.ip, self.ip_type, self.port, self.coldkey, self.modality )
+        if self._encoded != None and self._encoded[0] == spec:
+            return self._encoded[1]
+        bytes_json = bytes(self.dumps(), 'utf-8')
+        if len(bytes_json) > ENDPOINT_BUFFER_SIZE:
+            raise ValueError('Endpoint {} representation is too large, got size {} should be less than {}'.format(self, len(bytes_json), ENDPOINT_BUFFER_SIZE))
+        self._encoded = ( spec, bytes_json )
+        return bytes_json
+
     def dumps(self):
         """ Return json with the endpoints's specification
         """ 
@@ -34,6 +34,7 @@ class metagraph:
             subtensor: 'bittensor.Subtensor' = None,
             network: str = None,
             chain_endpoint: str = None,
+            sparse_weights: bool = False,
         ) -> 'bittensor.Metagraph':
         r""" Creates a new bittensor.Metagraph object from passed arguments.
             Args:
@@ -50,13 +51,15 @@ class metagraph:
                     an entry point node from that network.
                 chain_endpoint (default=None, type=str)
                     The subtensor endpoint flag. If set, overrides the network argument.
+                sparse_weights (default=False, type=bool)
+                    If True, the metagraph stores the chain weight matrix as a sparse tensor.
         """      
         if config == None: 
             config = metagraph.config()
         config = copy.deepcopy(config)
         if subtensor == None:
             subtensor = bittensor.subtensor( network = network, chain_endpoint = chain_endpoint )
-        return metagraph_impl.Metagraph( subtensor = subtensor )
+        return metagraph_impl.Metagraph( subtensor = subtensor, sparse_weights = sparse_weights )
 
     @classmethod   
     def config(cls) -> 'bittensor.Config':
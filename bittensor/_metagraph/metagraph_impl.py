@@ -18,11 +18,15 @@
 # DEALINGS IN THE SOFTWARE.
 
 import os
+import inspect
+import tempfile
+import zipfile
 
-from typing import List
+from typing import List, Tuple
 from loguru import logger
 
 import ast
+import numpy as np
 import pandas
 import torch.nn.functional as f
 import torch
@@ -32,10 +36,24 @@ import json
 import bittensor
 import bittensor.utils.networking as net
 import bittensor.utils.weight_utils as weight_utils
+from bittensor._endpoint import ENDPOINT_BUFFER_SIZE
 
 RAOPERTAO = 1000000000
 U64MAX = 18446744073709551615
 
+# Newer torch releases can memory-map saved state (mmap) and skip unpickling arbitrary objects (weights_only).
+TORCH_LOAD_KWARGS = { kwarg: True for kwarg in ('mmap', 'weights_only') if kwarg in inspect.signature( torch.load ).parameters }
+
+def triples_to_indices_and_values( rows: List[int], cols: List[int], vals: List[int] ) -> Tuple[torch.LongTensor, torch.LongTensor]:
+    r""" Converts (row, col, value) triples into a (2, nnz) index tensor and a value tensor, ordered by row so that
+        a single index_put_ over them walks the destination matrix row after row.
+    """
+    rows = np.asarray( rows, dtype=np.int64 )
+    order = np.argsort( rows, kind='stable' )
+    indices = np.stack( [ rows[order], np.asarray( cols, dtype=np.int64 )[order] ] )
+    values = np.asarray( vals, dtype=np.int64 )[order]
+    return torch.from_numpy( indices ), torch.from_numpy( values )
+
 class Metagraph( torch.nn.Module ):
     r""" Maintains chain state as a torch.nn.Module.
 
@@ -56,40 +74,54 @@ class Metagraph( torch.nn.Module ):
                 Last emission call for each neuron ordered by uid.
 
             weights (:obj:`torch.FloatTensor` of shape :obj:`(metagraph.n, metagraph.n)`):
-                Full weight matrix on chain ordered by uid.
+                Full weight matrix on chain ordered by uid. Stored as a sparse COO tensor when
+                the metagraph is created with sparse_weights = True.
 
             neurons (:obj:`torch.LongTensor` of shape :obj:`(metagraph.n, -1)`) 
                 Tokenized endpoint information.
 
     """
-    def __init__( self, subtensor ):
+    def __init__( self, subtensor, sparse_weights: bool = False ):
         r""" Initializes a new Metagraph torch chain interface object.
+            Args:
+                subtensor (:obj:`bittensor.Subtensor`, `required`):
+                    bittensor subtensor chain connection.
+                sparse_weights (:obj:`bool`, `optional`, defaults to False):
+                    If True, the weight matrix is stored as a sparse COO tensor built from
+                    the chain's (uid, weight) pairs instead of a dense (n, n) tensor.
         """
         super(Metagraph, self).__init__()
         self.subtensor = subtensor
+        self.sparse_weights = sparse_weights
         self.clear()
 
     def clear( self ) -> 'Metagraph':
         r""" Erases Metagraph state.
         """
-        self.version = torch.nn.Parameter( torch.tensor( [ bittensor.__version_as_int__ ], dtype=torch.int64), requires_grad=False )
-        self.n = torch.nn.Parameter( torch.tensor( [0], dtype=torch.int64), requires_grad = False )
-        self.tau = torch.nn.Parameter( torch.tensor( [1], dtype=torch.float32), requires_grad = False )
-        self.block = torch.nn.Parameter( torch.tensor( [0], dtype=torch.int64), requires_grad = False )
-        self.stake = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.ranks = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.trust = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.consensus = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.incentive = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.emission = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.dividends = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.active = torch.nn.Parameter(  torch.tensor( [], dtype=torch.int64), requires_grad=False )
-        self.last_update = torch.nn.Parameter(  torch.tensor( [], dtype=torch.int64), requires_grad=False )
-        self.weights = torch.nn.Parameter(  torch.tensor( [], dtype=torch.float32), requires_grad=False )
-        self.bonds = torch.nn.Parameter(  torch.tensor( [], dtype=torch.int64), requires_grad=False )
-        self.endpoints = torch.nn.Parameter( torch.tensor( [], dtype=torch.int64), requires_grad=False )
-        self.uids = torch.nn.Parameter( torch.tensor([], dtype = torch.int64),requires_grad=False )
+        self.register_buffer( 'version', torch.tensor( [ bittensor.__version_as_int__ ], dtype=torch.int64) )
+        self.register_buffer( 'n', torch.tensor( [0], dtype=torch.int64) )
+        self.register_buffer( 'tau', torch.tensor( [1], dtype=torch.float32) )
+        self.register_buffer( 'block', torch.tensor( [0], dtype=torch.int64) )
+        self.register_buffer( 'stake', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'ranks', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'trust', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'consensus', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'incentive', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'emission', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'dividends', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'active', torch.empty( 0, dtype=torch.int64 ) )
+        self.register_buffer( 'last_update', torch.empty( 0, dtype=torch.int64 ) )
+        self.register_buffer( 'weights', torch.empty( 0, dtype=torch.float32 ) )
+        self.register_buffer( 'bonds', torch.empty( 0, dtype=torch.int64 ) )
+        self.register_buffer( 'endpoints', torch.empty( 0, dtype=torch.int64 ) )
+        self.register_buffer( 'uids', torch.empty( 0, dtype=torch.int64 ) )
         self._endpoint_objs = None
+        self._endpoint_cache = {}
+        self._hotkeys = None
+        self._hotkey_to_uid = None
+        self._last_saved_sig = None
+        self._skipped_fields = frozenset()
+        self._dense_cache = {}
         return self
 
     def forward (
@@ -217,13 +249,26 @@ class Metagraph( torch.nn.Module ):
     def B(self) -> torch.FloatTensor:
         """ Bonds
         """
-        return self.bonds
+        return self._dense( 'bonds' )
     
     @property
     def W(self) -> torch.FloatTensor:
         """ Weights
         """
-        return self.weights
+        return self._dense( 'weights' )
+
+    def _dense( self, name:str ) -> torch.Tensor:
+        r""" Returns the named buffer as a dense tensor. A sparse buffer is densified once and the result
+            reused until sync or load replaces the buffer, so repeated W[uid] lookups do not rebuild it.
+        """
+        buffer = getattr( self, name )
+        if not buffer.is_sparse:
+            return buffer
+        sparse, dense = self._dense_cache.get( name, ( None, None ) )
+        if sparse is not buffer:
+            dense = buffer.to_dense()
+            self._dense_cache[ name ] = ( buffer, dense )
+        return dense
 
     @property
     def hotkeys( self ) -> List[str]:
@@ -234,7 +279,10 @@ class Metagraph( torch.nn.Module ):
         """
         if self.n.item() == 0:
             return []
-        return [ neuron.hotkey if neuron != bittensor.endpoint.dummy() else '' for neuron in self.endpoint_objs ]
+        if self._hotkeys == None:
+            dummy = bittensor.endpoint.dummy()
+            self._hotkeys = [ neuron.hotkey if neuron != dummy else '' for neuron in self.endpoint_objs ]
+        return self._hotkeys
 
     @property
     def coldkeys( self ) -> List[str]:
@@ -245,7 +293,8 @@ class Metagraph( torch.nn.Module ):
         """
         if self.n.item() == 0:
             return []
-        return [ neuron.coldkey if neuron != bittensor.endpoint.dummy() else '' for neuron in self.endpoint_objs ]
+        dummy = bittensor.endpoint.dummy()
+        return [ neuron.coldkey if neuron != dummy else '' for neuron in self.endpoint_objs ]
 
     @property
     def modalities( self ) -> List[str]:
@@ -256,7 +305,8 @@ class Metagraph( torch.nn.Module ):
         """
         if self.n.item() == 0:
             return []
-        return [ neuron.modality if neuron != bittensor.endpoint.dummy() else '' for neuron in self.endpoint_objs ]
+        dummy = bittensor.endpoint.dummy()
+        return [ neuron.modality if neuron != dummy else '' for neuron in self.endpoint_objs ]
 
     @property
     def addresses( self ) -> List[str]:
@@ -267,7 +317,9 @@ class Metagraph( torch.nn.Module ):
         """
         if self.n.item() == 0:
             return []
-        return [ net.ip__str__( neuron.ip_type, neuron.ip, neuron.port ) if neuron != bittensor.endpoint.dummy() else '' for neuron in self.endpoint_objs ]
+        # Build the dummy once, each endpoint.dummy() parses its ip through netaddr.
+        dummy = bittensor.endpoint.dummy()
+        return [ net.ip__str__( neuron.ip_type, neuron.ip, neuron.port ) if neuron != dummy else '' for neuron in self.endpoint_objs ]
 
     @property
     def endpoint_objs( self ) -> List['bittensor.Endpoint']:
@@ -281,10 +333,7 @@ class Metagraph( torch.nn.Module ):
         elif self._endpoint_objs != None:
             return self._endpoint_objs
         else:
-            self._endpoint_objs = []
-            for tensor in self.endpoints:
-                obj = bittensor.endpoint.from_tensor( tensor )
-                self._endpoint_objs.append( obj )
+            self._endpoint_objs = bittensor.endpoint.from_tensor_batch( self.endpoints )
             return self._endpoint_objs
 
     def hotkey_to_uid( self, hotkey:str ) -> int:
@@ -297,10 +346,10 @@ class Metagraph( torch.nn.Module ):
                 uid: (`int`):
                     The uid for specified hotkey, -1 if hotkey does not exist.
         """ 
-        if hotkey in self.hotkeys:
-            return self.hotkeys.index(hotkey) 
-        else:
-            return -1
+        if self._hotkey_to_uid == None:
+            # Iterate in reverse so that the first uid wins for duplicate (empty) hotkeys.
+            self._hotkey_to_uid = { hk: uid for uid, hk in reversed( list( enumerate( self.hotkeys ) ) ) }
+        return self._hotkey_to_uid.get( hotkey, -1 )
 
     def load( self, network:str = None  ) -> 'Metagraph':
         r""" Loads this metagraph object's state_dict from bittensor root dir.
@@ -338,45 +387,127 @@ class Metagraph( torch.nn.Module ):
                     Path to load state_dict.
         """
         full_path = os.path.expanduser(path)
-        metastate = torch.load( full_path )
-        return self.load_from_state_dict( metastate )
+        load_kwargs = TORCH_LOAD_KWARGS
+        if not zipfile.is_zipfile( full_path ):
+            try:
+                self._migrate_legacy_save( full_path )
+            except Exception as e:
+                # E.g. a read-only file or directory, load the legacy file as it is, which can not be memory-mapped.
+                logger.warning('Could not migrate legacy metagraph save: {}, loading it without mmap. Error: {}', full_path, e)
+                load_kwargs = { kwarg: value for kwarg, value in TORCH_LOAD_KWARGS.items() if kwarg != 'mmap' }
+        # With mmap the tensor storages are backed by the file and only paged in when read.
+        metastate = torch.load( full_path, map_location = 'cpu', **load_kwargs )
+        self._assign_state_dict( metastate, owned = True )
+        self._last_saved_sig = self._save_sig( full_path )
+        return self
 
     def save_to_path(self, path:str, filename:str ) -> 'Metagraph':
         r""" Saves this metagraph object's state_dict to the specified path.
             Args: 
                 path: (:obj:`str`, required):
                     Path to save state_dict.
+                filename: (:obj:`str`, required):
+                    Name of the state_dict file under path.
+            The write is skipped if this exact state (n, block, skipped fields) was already saved to or loaded from the file,
+            and refused if the last sync skipped some fields, so that a partial state never replaces a full one.
         """
         full_path = os.path.expanduser(path)
+        save_path = full_path + '/' + filename
+        if len( self._skipped_fields ) > 0:
+            logger.warning('Did not save metagraph to path: {}, the last sync skipped fields {}. Run metagraph.sync() first.', save_path, sorted( self._skipped_fields ))
+            return self
+        save_sig = self._save_sig( save_path )
+        if save_sig == self._last_saved_sig and os.path.isfile( save_path ):
+            return self
         os.makedirs(full_path, exist_ok=True)
         metastate = self.state_dict()
-        torch.save(metastate, full_path + '/' + filename)
+        # Write through a temporary file, a metagraph loaded with mmap may still be backed by the target file.
+        self._replace_file( metastate, save_path )
+        self._last_saved_sig = save_sig
         return self
 
+    @staticmethod
+    def _migrate_legacy_save( full_path:str ):
+        r""" Rewrites a state_dict saved in the legacy (pre-zipfile) torch format in the zipfile format,
+            which is required to memory-map it on load.
+        """
+        legacy_load_kwargs = { kwarg: value for kwarg, value in TORCH_LOAD_KWARGS.items() if kwarg != 'mmap' }
+        metastate = torch.load( full_path, map_location = 'cpu', **legacy_load_kwargs )
+        Metagraph._replace_file( metastate, full_path )
+
+    @staticmethod
+    def _replace_file( metastate:dict, full_path:str ):
+        r""" Saves metastate to a uniquely named temporary file next to full_path and swaps it in, so that
+            concurrent writers (e.g. several neurons on one host) never share or observe a partial file.
+        """
+        directory, filename = os.path.split( full_path )
+        tmp_fd, tmp_path = tempfile.mkstemp( dir = directory, prefix = filename, suffix = '.tmp' )
+        try:
+            with os.fdopen( tmp_fd, 'wb' ) as tmp_file:
+                torch.save( metastate, tmp_file, _use_new_zipfile_serialization = True )
+            # mkstemp creates the file with mode 0600, give it the mode a plain open() would have.
+            umask = os.umask( 0 )
+            os.umask( umask )
+            os.chmod( tmp_path, 0o666 & ~umask )
+            os.replace( tmp_path, full_path )
+        except:
+            if os.path.exists( tmp_path ):
+                os.remove( tmp_path )
+            raise
+
+    def _save_sig( self, path:str ) -> tuple:
+        r""" Returns the (path, n, block, skipped fields) signature identifying the persisted state.
+        """
+        return ( os.path.abspath( path ), int( self.n.item() ), int( self.block.item() ), self._skipped_fields )
+
+    def _assign_buffer( self, name:str, tensor:torch.Tensor, owned:bool = False ):
+        r""" Sets the named buffer to tensor. Copies in place when the existing buffer already has the same
+            shape, dtype and layout, so that outside references (e.g. to metagraph.S) stay valid.
+            Otherwise the buffer is rebound to tensor, which is cloned first unless owned is True, so that
+            a later in place copy never writes into a tensor the caller still holds.
+        """
+        buffer = getattr( self, name )
+        if buffer.layout == torch.strided and tensor.layout == torch.strided and buffer.shape == tensor.shape and buffer.dtype == tensor.dtype:
+            buffer.copy_( tensor )
+        else:
+            setattr( self, name, tensor if owned else tensor.clone() )
+
     def load_from_state_dict(self, state_dict:dict ) -> 'Metagraph':
         r""" Loads this metagraph object from passed state_dict.
             Args: 
                 state_dict: (:obj:`dict`, required):
                     Metagraph state_dict. Must be same as that created by save_to_path.
         """
-        self.version = torch.nn.Parameter( state_dict['version'], requires_grad=False )
-        self.n = torch.nn.Parameter( state_dict['n'], requires_grad=False )
-        self.tau = torch.nn.Parameter( state_dict['tau'], requires_grad=False )
-        self.block = torch.nn.Parameter( state_dict['block'], requires_grad=False )
-        self.uids = torch.nn.Parameter( state_dict['uids'], requires_grad=False )
-        self.stake = torch.nn.Parameter( state_dict['stake'], requires_grad=False )
-        self.ranks = torch.nn.Parameter( state_dict['ranks'], requires_grad=False )
-        self.trust = torch.nn.Parameter( state_dict['trust'], requires_grad=False )
-        self.consensus = torch.nn.Parameter( state_dict['consensus'], requires_grad=False )
-        self.incentive = torch.nn.Parameter( state_dict['incentive'], requires_grad=False )
-        self.emission = torch.nn.Parameter( state_dict['emission'], requires_grad=False )
-        self.dividends = torch.nn.Parameter( state_dict['dividends'], requires_grad=False )
-        self.active = torch.nn.Parameter( state_dict['active'], requires_grad=False )
-        self.last_update = torch.nn.Parameter( state_dict['last_update'], requires_grad=False )
-        self.weights = torch.nn.Parameter( state_dict['weights'], requires_grad=False )
-        self.bonds = torch.nn.Parameter( state_dict['bonds'], requires_grad=False )
-        self.endpoints = torch.nn.Parameter( state_dict['endpoints'], requires_grad=False )
+        return self._assign_state_dict( state_dict, owned = False )
+
+    def _assign_state_dict(self, state_dict:dict, owned:bool ) -> 'Metagraph':
+        r""" Assigns the buffers from state_dict, owned is True when no one else holds its tensors
+            (e.g. freshly loaded from file), they are then used without a copy.
+        """
+        self._assign_buffer( 'version', state_dict['version'], owned )
+        self._assign_buffer( 'n', state_dict['n'], owned )
+        self._assign_buffer( 'tau', state_dict['tau'], owned )
+        self._assign_buffer( 'block', state_dict['block'], owned )
+        self._assign_buffer( 'uids', state_dict['uids'], owned )
+        self._assign_buffer( 'stake', state_dict['stake'], owned )
+        self._assign_buffer( 'ranks', state_dict['ranks'], owned )
+        self._assign_buffer( 'trust', state_dict['trust'], owned )
+        self._assign_buffer( 'consensus', state_dict['consensus'], owned )
+        self._assign_buffer( 'incentive', state_dict['incentive'], owned )
+        self._assign_buffer( 'emission', state_dict['emission'], owned )
+        self._assign_buffer( 'dividends', state_dict['dividends'], owned )
+        self._assign_buffer( 'active', state_dict['active'], owned )
+        self._assign_buffer( 'last_update', state_dict['last_update'], owned )
+        self._assign_buffer( 'weights', state_dict['weights'], owned )
+        self._assign_buffer( 'bonds', state_dict['bonds'], owned )
+        self._assign_buffer( 'endpoints', state_dict['endpoints'], owned )
         self._endpoint_objs = None
+        self._endpoint_cache = {}
+        self._hotkeys = None
+        self._hotkey_to_uid = None
+        self._last_saved_sig = None
+        self._skipped_fields = frozenset()
+        self._dense_cache = {}
         return self
 
     def retrieve_cached_neurons( self, block: int = None ):
@@ -423,8 +554,17 @@ class Metagraph( torch.nn.Module ):
 
         return neurons
 
-    def sync ( self, block: int = None, cached: bool = True ) -> 'Metagraph':
+    def sync ( self, block: int = None, cached: bool = True, weights: bool = True, bonds: bool = True ) -> 'Metagraph':
         r""" Synchronizes this metagraph with the chain state.
+            Args:
+                block (:obj:`int`, `optional`):
+                    Block to sync from, defaults to the current block.
+                cached (:obj:`bool`, `optional`, defaults to True):
+                    If True, pulls the neurons from the IPFS cache on nakamoto and local.
+                weights (:obj:`bool`, `optional`, defaults to True):
+                    If False, the (n, n) weight matrix is not built and set to an empty sparse tensor.
+                bonds (:obj:`bool`, `optional`, defaults to True):
+                    If False, the (n, n) bond matrix is not built and set to an empty sparse tensor.
         """
         if block == None:
             block = self.subtensor.get_current_block()
@@ -473,20 +613,23 @@ class Metagraph( torch.nn.Module ):
                 n_total = len(neurons)
 
         # Fill arrays.
-        uids = [ i for i in range(n_total) ]
-        active = [ 0 for _ in range(n_total) ]
-        stake = [ 0 for _ in range(n_total) ]
-        ranks = [ 0 for _ in range(n_total) ]
-        trust = [ 0 for _ in range(n_total) ]
-        consensus = [ 0 for _ in range(n_total) ]
-        incentive = [ 0 for _ in range(n_total) ]
-        emission = [ 0 for _ in range(n_total) ]
-        dividends = [ 0 for _ in range(n_total) ]
-        last_updates = [ -1 for _ in range(n_total) ]
-        endpoints = [ [-1 for _ in range(250) ]  for _ in range(n_total) ]
-        weights = [ [ 0 for _ in range(n_total) ] for _ in range(n_total) ]
-        bonds = [ [0 for _ in range(n_total) ] for _ in range(n_total) ]
-        self._endpoint_objs = [ bittensor.endpoint.dummy() for _ in range(n_total) ]
+        uids = np.arange( n_total, dtype=np.int64 )
+        active = np.zeros( n_total, dtype=np.int64 )
+        # The float fields are row views into one contiguous (7, n) buffer.
+        float_fields = np.zeros( (7, n_total), dtype=np.float32 )
+        stake, ranks, trust, consensus, incentive, emission, dividends = float_fields
+        last_updates = np.full( n_total, -1, dtype=np.int64 )
+        endpoints = np.full( (n_total, ENDPOINT_BUFFER_SIZE), -1, dtype=np.int64 )
+        prev_endpoints = self.endpoints.cpu().numpy()
+        # Only reuse cached endpoints for uids the previous endpoints buffer holds a row for,
+        # e.g. not after syncing a smaller (older or truncated) network.
+        prev_endpoint_cache = { uid: cached for uid, cached in self._endpoint_cache.items() if uid < min( n_total, prev_endpoints.shape[0] ) }
+        # The new cache and endpoint objects are only swapped in with the buffers, so a sync that raises
+        # part way leaves them consistent with the endpoints buffer.
+        endpoint_cache = {}
+        endpoint_objs = [ bittensor.endpoint.dummy() for _ in range(n_total) ]
+        w_rows, w_cols, w_vals = [], [], []
+        b_rows, b_cols, b_vals = [], [], []
         for n in neurons:
             uids[n.uid] = n.uid 
             active[n.uid] = n.active
@@ -498,65 +641,83 @@ class Metagraph( torch.nn.Module ):
             dividends[n.uid] = n.dividends
             emission[n.uid] = n.emission
             last_updates[n.uid] = n.last_update
-            endpoint =  bittensor.endpoint(
-                version = int(n.version),
-                uid = int(n.uid), 
-                hotkey = str(n.hotkey), 
-                ip_type = int(n.ip_type), 
-                ip = str(n.ip), 
-                port = int(n.port), 
-                modality = int(n.modality), 
-                coldkey = str(n.coldkey) 
-            )
-            self._endpoint_objs[n.uid] = endpoint 
-            endpoints[n.uid] = endpoint.to_tensor().tolist()
-            if len(n.weights) > 0:
-                w_uids, w_weights = zip(*n.weights)
-                weights[n.uid] = weight_utils.convert_weight_uids_and_vals_to_tensor( n_total, w_uids, w_weights ).tolist()
+            # Reuse the endpoint built on a previous sync if the neuron's serving info has not changed,
+            # its encoded row is then still held by the current endpoints buffer.
+            endpoint_key = ( int(n.version), int(n.uid), str(n.hotkey), str(n.coldkey), str(n.ip), int(n.ip_type), int(n.port), int(n.modality) )
+            cached_endpoint = prev_endpoint_cache.get( n.uid )
+            if cached_endpoint != None and cached_endpoint[0] == endpoint_key:
+                _, endpoint = cached_endpoint
+                endpoints[n.uid] = prev_endpoints[n.uid]
             else:
-                weights[n.uid] = [0] * n_total
-            if len(n.bonds) > 0:
+                endpoint =  bittensor.endpoint(
+                    version = int(n.version),
+                    uid = int(n.uid), 
+                    hotkey = str(n.hotkey), 
+                    ip_type = int(n.ip_type), 
+                    ip = str(n.ip), 
+                    port = int(n.port), 
+                    modality = int(n.modality), 
+                    coldkey = str(n.coldkey) 
+                )
+                endpoint.write_into( endpoints[n.uid] )
+            endpoint_cache[ n.uid ] = ( endpoint_key, endpoint )
+            endpoint_objs[n.uid] = endpoint 
+            # Collect the sparse chain rows as (row, uid, value) triples.
+            if weights and len(n.weights) > 0:
+                w_uids, w_weights = zip(*n.weights)
+                w_rows.extend( [n.uid] * len(w_uids) )
+                w_cols.extend( w_uids )
+                w_vals.extend( w_weights )
+            if bonds and len(n.bonds) > 0:
                 b_uids, b_bonds = zip(*n.bonds)
-                bonds[n.uid] = weight_utils.convert_bond_uids_and_vals_to_tensor( n_total, b_uids, b_bonds ).tolist()
-            else:
-                bonds[n.uid] = [0] * n_total
+                b_rows.extend( [n.uid] * len(b_uids) )
+                b_cols.extend( b_uids )
+                b_vals.extend( b_bonds )
 
         # Set tensors.
         tn = torch.tensor( n_total, dtype=torch.int64 )
         tblock = torch.tensor( block, dtype=torch.int64 )
-        tuids = torch.tensor( uids, dtype=torch.int64 )
-        tactive = torch.tensor( active, dtype=torch.int64 )
-        tstake = torch.tensor( stake, dtype=torch.float32 )
-        tranks = torch.tensor( ranks, dtype=torch.float32 )
-        ttrust = torch.tensor( trust, dtype=torch.float32 )
-        tconsensus = torch.tensor( consensus, dtype=torch.float32 )
-        tincentive = torch.tensor( incentive, dtype=torch.float32 )
-        temission = torch.tensor( emission, dtype=torch.float32 )
-        tdividends = torch.tensor( dividends, dtype=torch.float32 )
-        tlast_update = torch.tensor( last_updates, dtype=torch.int64 )
-        tbonds = torch.tensor( bonds, dtype=torch.int64 )
-        tweights = torch.tensor( weights, dtype=torch.float32 )
-        tendpoints = torch.tensor( endpoints, dtype=torch.int64 )
-
-        # Normalize bond ownership.
-        tbonds = torch.nn.functional.normalize( tbonds.float(), p=1, dim=0, eps=1e-12 ) * 0.5 + torch.eye( tn ) * 0.5
-
-        # Set params.
-        self.n = torch.nn.Parameter( tn, requires_grad=False )
-        self.block = torch.nn.Parameter( tblock, requires_grad=False )
-        self.uids = torch.nn.Parameter( tuids, requires_grad=False )
-        self.stake = torch.nn.Parameter( tstake, requires_grad=False )
-        self.ranks = torch.nn.Parameter( tranks, requires_grad=False )
-        self.trust = torch.nn.Parameter( ttrust, requires_grad=False )
-        self.consensus = torch.nn.Parameter( tconsensus, requires_grad=False )
-        self.incentive = torch.nn.Parameter( tincentive, requires_grad=False )
-        self.emission = torch.nn.Parameter( temission, requires_grad=False )
-        self.dividends = torch.nn.Parameter( tdividends, requires_grad=False )
-        self.active = torch.nn.Parameter( tactive, requires_grad=False )
-        self.last_update = torch.nn.Parameter( tlast_update, requires_grad=False )
-        self.weights = torch.nn.Parameter( tweights, requires_grad=False )
-        self.bonds = torch.nn.Parameter( tbonds, requires_grad=False )
-        self.endpoints = torch.nn.Parameter( tendpoints, requires_grad=False )
+        tuids = torch.from_numpy( uids )
+        tactive = torch.from_numpy( active )
+        tstake, tranks, ttrust, tconsensus, tincentive, temission, tdividends = torch.from_numpy( float_fields )
+        tlast_update = torch.from_numpy( last_updates )
+        tendpoints = torch.from_numpy( endpoints )
+        w_indices, w_values = triples_to_indices_and_values( w_rows, w_cols, w_vals )
+        w_values = ( w_values.double() / weight_utils.U32_MAX ).float()
+        if self.sparse_weights or not weights:
+            tweights = torch.sparse_coo_tensor( w_indices, w_values, (n_total, n_total) ).coalesce()
+        else:
+            tweights = torch.zeros( (n_total, n_total), dtype=torch.float32 ).index_put_( tuple( w_indices ), w_values )
+        if bonds:
+            b_indices, b_values = triples_to_indices_and_values( b_rows, b_cols, b_vals )
+            tbonds = torch.zeros( (n_total, n_total), dtype=torch.int64 ).index_put_( tuple( b_indices ), b_values )
+
+            # Normalize bond ownership.
+            tbonds = torch.nn.functional.normalize( tbonds.float(), p=1, dim=0, eps=1e-12 ) * 0.5 + torch.eye( tn ) * 0.5
+        else:
+            tbonds = torch.sparse_coo_tensor( torch.empty( (2, 0), dtype=torch.int64 ), torch.empty( 0, dtype=torch.float32 ), (n_total, n_total) )
+
+        # Set buffers.
+        self._skipped_fields = frozenset( name for name, synced in ( ( 'weights', weights ), ( 'bonds', bonds ) ) if not synced )
+        self._assign_buffer( 'n', tn, owned = True )
+        self._assign_buffer( 'block', tblock, owned = True )
+        self._assign_buffer( 'uids', tuids, owned = True )
+        self._assign_buffer( 'stake', tstake, owned = True )
+        self._assign_buffer( 'ranks', tranks, owned = True )
+        self._assign_buffer( 'trust', ttrust, owned = True )
+        self._assign_buffer( 'consensus', tconsensus, owned = True )
+        self._assign_buffer( 'incentive', tincentive, owned = True )
+        self._assign_buffer( 'emission', temission, owned = True )
+        self._assign_buffer( 'dividends', tdividends, owned = True )
+        self._assign_buffer( 'active', tactive, owned = True )
+        self._assign_buffer( 'last_update', tlast_update, owned = True )
+        self._assign_buffer( 'weights', tweights, owned = True )
+        self._assign_buffer( 'bonds', tbonds, owned = True )
+        self._assign_buffer( 'endpoints', tendpoints, owned = True )
+        self._endpoint_cache = endpoint_cache
+        self._endpoint_objs = endpoint_objs
+        self._hotkeys = None
+        self._hotkey_to_uid = None
             
         # For contructor.
         return self
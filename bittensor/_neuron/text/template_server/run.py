@@ -104,7 +104,9 @@ def serve( config, model ):
             current_block = subtensor.get_current_block()
 
         nn = subtensor.neuron_for_pubkey(wallet.hotkey.ss58_address)
-        uid = metagraph.hotkeys.index( wallet.hotkey.ss58_address )
+        uid = metagraph.hotkey_to_uid( wallet.hotkey.ss58_address )
+        if uid == -1:
+            raise ValueError('Hotkey {} is not registered in the metagraph'.format( wallet.hotkey.ss58_address ))
         wandb_data = {
             'stake': nn.stake,
             'rank': nn.rank,
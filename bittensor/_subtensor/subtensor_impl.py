@@ -20,7 +20,6 @@ from typing import List, Dict, Union
 from multiprocessing import Process
 
 import bittensor
-from tqdm import tqdm
 import bittensor.utils.networking as net
 import bittensor.utils.weight_utils as weight_utils
 from retry import retry
@@ -889,14 +888,27 @@ To run a local node (See: docs/running_a_validator.md) \n
             neuron (List[SimpleNamespace]):
                 List of neuron objects.
         """
+        # Pull the whole Neurons map in pages rather than issuing one query per uid.
+        # Pages are fetched lazily while iterating, so the whole iteration is retried, not just the first page.
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry():
+            with self.substrate as substrate:
+                result = substrate.query_map(
+                    module='SubtensorModule',
+                    storage_function='Neurons',
+                    block_hash = None if block == None else substrate.get_block_hash( block ),
+                    page_size = 256
+                )
+                return [ dict( r[1].value ) for r in result ]
+        # Raises once the retries are exhausted, an empty list would read as an empty network.
+        neuron_dicts = make_substrate_call_with_retry()
+        neuron_dicts.sort( key = lambda neuron_dict: neuron_dict['uid'] )
         neurons = []
-        for id in tqdm(range(self.get_n( block ))): 
-            try:
-                neuron = self.neuron_for_uid(id, block)
-                neurons.append( neuron )
-            except Exception as e:
-                logger.error('Exception encountered when pulling neuron {}: {}'.format(id, e))
+        for uid, neuron_dict in enumerate( neuron_dicts ):
+            # Keep only the contiguous uid prefix, as the per-uid pull did when a neuron was missing.
+            if neuron_dict['uid'] != uid:
                 break
+            neurons.append( Subtensor._neuron_dict_to_namespace( neuron_dict ) )
         return neurons
 
     @staticmethod
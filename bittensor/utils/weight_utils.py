@@ -33,8 +33,9 @@ def convert_weight_uids_and_vals_to_tensor( n: int, uids: List[int], weights: Li
                 Tensor of weights.
     """
     row_weights = torch.zeros( [ n ], dtype=torch.float32 )
-    for uid_j, wij in list(zip( uids, weights )):
-        row_weights[ uid_j ] = float( wij ) / float(U32_MAX)
+    if len(uids) > 0:
+        # Single scatter, values are normalized in float64 before the float32 store.
+        row_weights[ torch.tensor( uids, dtype=torch.int64 ) ] = ( torch.tensor( weights, dtype=torch.float64 ) / float(U32_MAX) ).float()
     return row_weights
 
 def convert_bond_uids_and_vals_to_tensor( n: int, uids: List[int], bonds: List[int] ):
@@ -48,8 +49,8 @@ def convert_bond_uids_and_vals_to_tensor( n: int, uids: List[int], bonds: List[i
                 Tensor of bonds.
     """
     row_bonds = torch.zeros( [ n ], dtype=torch.int64 )
-    for uid_j, bij in list(zip( uids, bonds )):
-        row_bonds[ uid_j ] = int( bij ) 
+    if len(uids) > 0:
+        row_bonds[ torch.tensor( uids, dtype=torch.int64 ) ] = torch.tensor( bonds, dtype=torch.int64 )
     return row_bonds
 
 def convert_weights_and_uids_for_emit( uids: torch.LongTensor, weights: torch.FloatTensor ) -> Tuple[List[int], List[int]]:
@@ -1,5 +1,6 @@
 import bittensor 
 import torch
+import numpy
 import random
 import sys
 
@@ -125,6 +126,17 @@ def test_endpoint_to_tensor():
     assert torch.equal(tensor_endpoint, converted_endpoint.to_tensor())
     assert converted_endpoint.check_format() == True
 
+def test_endpoint_write_into():
+    row = numpy.zeros( 250, dtype=numpy.int64 )
+    endpoint.write_into( row )
+    assert torch.equal( torch.from_numpy( row ), endpoint.to_tensor() )
+    assert bittensor.endpoint.from_tensor( torch.from_numpy( row ) ) == endpoint
+
+def test_endpoint_from_tensor_batch():
+    tensor_endpoints = torch.stack( [ endpoint.to_tensor(), bittensor.endpoint.dummy().to_tensor() ] )
+    converted_endpoints = bittensor.endpoint.from_tensor_batch( tensor_endpoints )
+    assert converted_endpoints == [ endpoint, bittensor.endpoint.dummy() ]
+
 def test_thrash_equality_of_endpoint():
     n_tests = 10000
     for _ in range(n_tests):
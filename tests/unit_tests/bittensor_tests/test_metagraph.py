@@ -1,6 +1,11 @@
+import os
 import bittensor
 import torch
 import unittest
+import pytest
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 metagraph = None
 def test_create():
@@ -22,6 +27,112 @@ def test_load_sync_save():
 def test_factory():
     metagraph.load().sync().save()
 
+def test_sync_without_weights_and_bonds():
+    metagraph.sync( weights = False, bonds = False )
+    assert metagraph.weights.is_sparse
+    assert metagraph.bonds.is_sparse
+    assert list( metagraph.W.shape ) == [ metagraph.n.item(), metagraph.n.item() ]
+    assert list( metagraph.B.shape ) == [ metagraph.n.item(), metagraph.n.item() ]
+    metagraph.sync()
+    assert not metagraph.weights.is_sparse
+
+def _mock_neuron( uid:int ):
+    return SimpleNamespace( uid = uid, active = 1, stake = 1.0, rank = 0.1, trust = 0.1, consensus = 0.1, incentive = 0.1,
+        dividends = 0.1, emission = 0.1, last_update = 0, version = 1, hotkey = str(uid), coldkey = str(uid), ip = uid + 1,
+        ip_type = 4, port = 8091, modality = 0, weights = [ (uid, 1) ], bonds = [ (uid, 1) ] )
+
+def _mock_subtensor( n:int ):
+    subtensor = MagicMock( network = 'mock' )
+    subtensor.get_current_block.return_value = 1
+    subtensor.neurons.return_value = [ _mock_neuron( uid ) for uid in range( n ) ]
+    return subtensor
+
+def test_sync_shrink_then_grow():
+    mock_metagraph = bittensor.metagraph( subtensor = _mock_subtensor( 8 ) ).sync( cached = False )
+    for n in [ 4, 8 ]:
+        mock_metagraph.subtensor = _mock_subtensor( n )
+        mock_metagraph.sync( cached = False )
+        assert mock_metagraph.n.item() == n
+        assert mock_metagraph.hotkeys == [ str(uid) for uid in range( n ) ]
+    expected = bittensor.metagraph( subtensor = _mock_subtensor( 8 ) ).sync( cached = False )
+    assert torch.equal( mock_metagraph.endpoints, expected.endpoints )
+
+def test_sync_after_failed_sync():
+    mock_metagraph = bittensor.metagraph( subtensor = _mock_subtensor( 4 ) ).sync( cached = False )
+    neurons = mock_metagraph.subtensor.neurons.return_value
+    neurons[1].ip = 12345
+    neurons[3].hotkey = 'x' * 300
+    with pytest.raises( ValueError ):
+        mock_metagraph.sync( cached = False )
+    neurons[3].hotkey = '3'
+    mock_metagraph.sync( cached = False )
+    expected = bittensor.metagraph( subtensor = mock_metagraph.subtensor ).sync( cached = False )
+    assert torch.equal( mock_metagraph.endpoints, expected.endpoints )
+    assert mock_metagraph.endpoint_objs[1].ip == expected.endpoint_objs[1].ip
+
+def test_sparse_weights( tmp_path ):
+    subtensor = _mock_subtensor( 4 )
+    dense_metagraph = bittensor.metagraph( subtensor = subtensor ).sync( cached = False )
+    sparse_metagraph = bittensor.metagraph( subtensor = subtensor, sparse_weights = True ).sync( cached = False )
+    assert sparse_metagraph.weights.is_sparse
+    assert torch.equal( sparse_metagraph.W, dense_metagraph.W )
+    assert sparse_metagraph.W is sparse_metagraph.W
+    sparse_metagraph.save_to_path( str( tmp_path ), 'mock.pt' )
+    loaded_metagraph = bittensor.metagraph( subtensor = subtensor, sparse_weights = True ).load_from_path( str( tmp_path / 'mock.pt' ) )
+    assert loaded_metagraph.weights.is_sparse
+    assert torch.equal( loaded_metagraph.W, dense_metagraph.W )
+
+def test_save_after_partial_sync( tmp_path ):
+    mock_metagraph = bittensor.metagraph( subtensor = _mock_subtensor( 4 ) )
+    mock_metagraph.sync( cached = False, weights = False ).save_to_path( str( tmp_path ), 'mock.pt' )
+    assert not ( tmp_path / 'mock.pt' ).exists()
+    mock_metagraph.sync( cached = False ).save_to_path( str( tmp_path ), 'mock.pt' )
+    assert not bittensor.metagraph( subtensor = _mock_subtensor( 0 ) ).load_from_path( str( tmp_path / 'mock.pt' ) ).weights.is_sparse
+
+def test_load_from_state_dict_copies():
+    source = bittensor.metagraph( subtensor = _mock_subtensor( 4 ) ).sync( cached = False )
+    stake = source.stake.clone()
+    mock_metagraph = bittensor.metagraph( subtensor = _mock_subtensor( 4 ) ).load_from_state_dict( source.state_dict() )
+    mock_metagraph.subtensor.neurons.return_value[0].stake = 99.0
+    mock_metagraph.sync( cached = False )
+    assert mock_metagraph.stake[0].item() == 99.0
+    assert torch.equal( source.stake, stake )
+
+def test_save_skips_unchanged_state( tmp_path ):
+    mock_metagraph = bittensor.metagraph( subtensor = _mock_subtensor( 4 ) ).sync( cached = False )
+    mock_metagraph.save_to_path( str( tmp_path ), 'mock.pt' )
+    saved = os.stat( tmp_path / 'mock.pt' )
+    mock_metagraph.sync( cached = False ).save_to_path( str( tmp_path ), 'mock.pt' )
+    unchanged = os.stat( tmp_path / 'mock.pt' )
+    assert ( unchanged.st_ino, unchanged.st_mtime_ns ) == ( saved.st_ino, saved.st_mtime_ns )
+    mock_metagraph.subtensor.get_current_block.return_value = 2
+    mock_metagraph.sync( cached = False ).save_to_path( str( tmp_path ), 'mock.pt' )
+    rewritten = os.stat( tmp_path / 'mock.pt' )
+    assert ( rewritten.st_ino, rewritten.st_mtime_ns ) != ( saved.st_ino, saved.st_mtime_ns )
+    assert bittensor.metagraph( subtensor = _mock_subtensor( 0 ) ).load_from_path( str( tmp_path / 'mock.pt' ) ).block.item() == 2
+
+def test_load_legacy_save( tmp_path ):
+    source = bittensor.metagraph( subtensor = _mock_subtensor( 4 ) ).sync( cached = False )
+    legacy_path = tmp_path / 'legacy.pt'
+    torch.save( source.state_dict(), str( legacy_path ), _use_new_zipfile_serialization = False )
+    assert not zipfile.is_zipfile( str( legacy_path ) )
+    # A read-only directory, mkstemp is patched as file permissions do not apply to root.
+    readonly_path = tmp_path / 'readonly'
+    readonly_path.mkdir()
+    torch.save( source.state_dict(), str( readonly_path / 'legacy.pt' ), _use_new_zipfile_serialization = False )
+    os.chmod( str( readonly_path ), 0o555 )
+    try:
+        with patch( 'tempfile.mkstemp', side_effect = PermissionError( 'read-only directory' ) ):
+            loaded = bittensor.metagraph( subtensor = _mock_subtensor( 0 ) ).load_from_path( str( readonly_path / 'legacy.pt' ) )
+        assert torch.equal( loaded.stake, source.stake )
+        assert not zipfile.is_zipfile( str( readonly_path / 'legacy.pt' ) )
+    finally:
+        os.chmod( str( readonly_path ), 0o755 )
+    loaded = bittensor.metagraph( subtensor = _mock_subtensor( 0 ) ).load_from_path( str( legacy_path ) )
+    assert zipfile.is_zipfile( str( legacy_path ) )
+    assert torch.equal( loaded.endpoints, source.endpoints )
+    assert torch.equal( loaded.W, source.W )
+
 def test_forward():
     row = torch.ones( (metagraph.n), dtype = torch.float32 )
     for i in range( metagraph.n ):
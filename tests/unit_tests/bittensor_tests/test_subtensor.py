@@ -2,7 +2,7 @@ from typing import DefaultDict
 import bittensor
 import pytest
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from bittensor.utils.balance import Balance
 from substrateinterface import Keypair
 
@@ -68,6 +68,31 @@ class TestSubtensor(unittest.TestCase):
         with pytest.raises(RuntimeError):
             self.subtensor.connect()
 
+    def _mock_neuron_pages( self, n, fail_after = None ):
+        # Yields the Neurons map records like a lazily paged query_map, raising after fail_after records.
+        for uid in range( n ):
+            if uid == fail_after:
+                raise ConnectionError('page failed')
+            yield ( uid, MagicMock( value = { **vars( self.mock_neuron ), 'uid': uid } ) )
+
+    def test_neurons_retries_failed_page( self ):
+        substrate = MagicMock()
+        substrate.__enter__.return_value = substrate
+        substrate.query_map.side_effect = [ self._mock_neuron_pages( 4, fail_after = 2 ), self._mock_neuron_pages( 4 ) ]
+        self.subtensor.substrate = substrate
+        with patch( 'time.sleep' ):
+            neurons = self.subtensor.neurons()
+        assert [ neuron.uid for neuron in neurons ] == [ 0, 1, 2, 3 ]
+
+    def test_neurons_raises_when_unreachable( self ):
+        substrate = MagicMock()
+        substrate.__enter__.return_value = substrate
+        substrate.query_map.side_effect = ConnectionError('unreachable')
+        self.subtensor.substrate = substrate
+        with patch( 'time.sleep' ):
+            with pytest.raises( ConnectionError ):
+                self.subtensor.neurons()
+
 
     def test_neurons( self ):
         assert len(self.neurons) > 0
@@ -31,4 +31,18 @@ def test_convert_weight_and_uids():
     for _ in range (5):
         uids = torch.tensor(list(range(10))) 
         weights = torch.rand(10)
-        weight_utils.convert_weights_and_uids_for_emit( uids, weights )
\ No newline at end of file
+        weight_utils.convert_weights_and_uids_for_emit( uids, weights )
+
+def test_convert_weight_and_bond_uids_and_vals_to_tensor():
+    uids = [ 1, 3, 4 ]
+    weights = [ 0, 4294967295, 2147483647 ]
+    row_weights = weight_utils.convert_weight_uids_and_vals_to_tensor( 6, uids, weights )
+    assert row_weights.dtype == torch.float32
+    assert torch.allclose( row_weights, torch.tensor( [ 0, 0, 0, 1, 0.5, 0 ] ) )
+
+    row_bonds = weight_utils.convert_bond_uids_and_vals_to_tensor( 6, tuple(uids), ( 7, 8, 9 ) )
+    assert torch.equal( row_bonds, torch.tensor( [ 0, 7, 0, 8, 9, 0 ] ) )
+
+    # No entries on chain.
+    assert torch.equal( weight_utils.convert_weight_uids_and_vals_to_tensor( 3, [], [] ), torch.zeros( 3 ) )
+    assert torch.equal( weight_utils.convert_bond_uids_and_vals_to_tensor( 3, [], [] ), torch.zeros( 3, dtype=torch.int64 ) )